@@ -86,11 +86,11 @@ class Application(SubConfiguration):
             raise NexTRuntimeError("No active application to initialize")
         # make sure that the application is re-created before initializing it
         # this is needed to synchronize the properties, etc.
-        MethodInvoker(Application.activeApplication.getApplication().getConfiguration().activate,
-                      Qt.DirectConnection, Application.activeApplication.getApplication().getName())
-        MethodInvoker(Application.activeApplication.init, Qt.DirectConnection)
-        MethodInvoker(Application.activeApplication.open, Qt.DirectConnection)
-        MethodInvoker(Application.activeApplication.start, Qt.DirectConnection)
+        MethodInvoker.invoke(Application.activeApplication.getApplication().getConfiguration().activate,
+                             Qt.DirectConnection, Application.activeApplication.getApplication().getName())
+        MethodInvoker.invoke(Application.activeApplication.init, Qt.DirectConnection)
+        MethodInvoker.invoke(Application.activeApplication.open, Qt.DirectConnection)
+        MethodInvoker.invoke(Application.activeApplication.start, Qt.DirectConnection)
 
     @staticmethod
     @handleException
@@ -102,6 +102,6 @@ class Application(SubConfiguration):
         assertMainThread()
         if Application.activeApplication is None:
             raise NexTRuntimeError("No active application to initialize")
-        MethodInvoker(Application.activeApplication.stop, Qt.DirectConnection)
-        MethodInvoker(Application.activeApplication.close, Qt.DirectConnection)
-        MethodInvoker(Application.activeApplication.deinit, Qt.DirectConnection)
+        MethodInvoker.invoke(Application.activeApplication.stop, Qt.DirectConnection)
+        MethodInvoker.invoke(Application.activeApplication.close, Qt.DirectConnection)
+        MethodInvoker.invoke(Application.activeApplication.deinit, Qt.DirectConnection)
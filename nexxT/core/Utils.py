@@ -8,18 +8,23 @@
 This module contains various small utility classes.
 """
 
+import collections
+import functools
 import io
+import itertools
 import re
 import sys
 import logging
 import datetime
 import os.path
 import sqlite3
+import threading
 import time
 from PySide2.QtCore import (QObject, Signal, Slot, QMutex, QWaitCondition, QCoreApplication, QThread,
-                            QMutexLocker, QRecursiveMutex, QTimer, Qt, QPoint)
+                            QMutexLocker, QTimer, Qt, QPoint, QEventLoop, QMetaObject)
 from PySide2.QtGui import QColor, QPainter, QTextLayout, QTextOption
 from PySide2.QtWidgets import QFrame, QSizePolicy
+import shiboken2
 from nexxT.core.Exceptions import NexTInternalError, InvalidIdentifierException
 
 logger = logging.getLogger(__name__)
@@ -36,31 +41,166 @@ class MethodInvoker(QObject):
 
     IDLE_TASK = "IDLE_TASK"
 
-    def __init__(self, callback, connectiontype, *args):
+    # idle instances used by MethodInvoker.invoke(...), keyed by the C++ pointer of their thread
+    _pools = {}
+    POOL_SIZE = 256
+
+    # pending IDLE_TASK instances, keyed by the C++ pointer of their thread; the queues are guarded by _idleMutex
+    _idleQueues = {}
+    _idleMutex = QMutex()
+
+    def __init__(self, callback, connectiontype, *args, _pool=None):
         super().__init__()
-        self.args = args
+        self._pool = _pool
+        self._connected = False
+        self.args = ()
+        self.callback, thread = self._resolve(callback)
+        if not thread is None:
+            self.moveToThread(thread)
+        elif connectiontype != Qt.DirectConnection:
+            logger.warning("Using old style API, wrong thread might be used!")
+        self._start(connectiontype, args)
+
+    @staticmethod
+    def _resolve(callback):
+        """
+        Returns the callable and the thread where the callable shall be executed (None if unknown).
+        :param callback: see __init__
+        :return: a (callable, QThread) tuple
+        """
         if isinstance(callback, dict):
             obj = callback["object"]
             method = callback["method"]
-            self.callback = getattr(obj, method)
-            thread = callback["thread"] if "thread" in callback else obj.thread()
-        elif hasattr(callback, "__self__") and isinstance(callback.__self__, QObject):
-            self.callback = callback
-            thread = callback.__self__.thread()
-        else:
-            thread = None
-            self.callback = callback
-            if connectiontype != Qt.DirectConnection:
-                logger.warning("Using old style API, wrong thread might be used!")
-        if not thread is None:
-            self.moveToThread(thread)
+            return getattr(obj, method), (callback["thread"] if "thread" in callback else obj.thread())
+        if hasattr(callback, "__self__") and isinstance(callback.__self__, QObject):
+            return callback, callback.__self__.thread()
+        return callback, None
+
+    @staticmethod
+    def _callDirect(method, args):
+        """
+        Calls the method synchronously. Exceptions are reported the same way as PySide2 reports exceptions of
+        directly connected slots.
+        :param method: the callable
+        :param args: the arguments as a tuple
+        :return: None
+        """
+        try:
+            method(*args)
+        except Exception: # pylint: disable=broad-except
+            sys.excepthook(*sys.exc_info())
+
+    def _start(self, connectiontype, args):
+        self.args = args
+        if connectiontype == Qt.DirectConnection:
+            # emitting a directly connected signal just calls the slot in this thread, so skip the signal/slot
+            # machinery and the callbackWrapper frame
+            self._callDirect(self.callback, args)
+            return
         self.methodscalled.add(self)
+        self._connected = connectiontype is not self.IDLE_TASK
         if connectiontype is self.IDLE_TASK:
-            QTimer.singleShot(0, self.callbackWrapper)
+            # only the first pending idle task of a thread starts a timer, the others are run by the same drain
+            queue = self._idleQueue(self.thread())
+            with QMutexLocker(self._idleMutex):
+                queue.append(self)
+                schedule = len(queue) == 1
+            if schedule:
+                # the drain must be driven by the event loop of the target thread; a QTimer would be driven by the
+                # posting thread, which might not even have an event loop
+                QMetaObject.invokeMethod(self, "_drainIdle", Qt.QueuedConnection)
         else:
             self.signal.connect(self.callbackWrapper, connectiontype)
             self.signal.emit()
 
+    @classmethod
+    def invoke(cls, callback, connectiontype, *args):
+        """
+        Same as MethodInvoker(callback, connectiontype, *args), but idle instances are reused instead of creating a
+        new QObject for each call. Use this when the invoker instance is not needed by the caller.
+        :param callback: see __init__
+        :param connectiontype: see __init__
+        :param args: see __init__
+        :return: None
+        """
+        method, thread = cls._resolve(callback)
+        if connectiontype == Qt.DirectConnection:
+            cls._callDirect(method, args)
+            return
+        if thread is None:
+            cls(callback, connectiontype, *args)
+            return
+        pool = cls._perThread(cls._pools, thread, lambda: collections.deque(maxlen=cls.POOL_SIZE))
+        while True:
+            # the pool is shared between the calling threads, so it might be emptied concurrently
+            try:
+                invoker = pool.pop()
+            except IndexError:
+                break
+            # the pointer might have been reused by a new thread
+            if invoker.thread() == thread:
+                invoker.callback = method
+                invoker._start(connectiontype, args) # pylint: disable=protected-access
+                return
+        cls(callback, connectiontype, *args, _pool=pool)
+
+    @classmethod
+    def _perThread(cls, registry, thread, factory):
+        """
+        Returns the entry of the given thread in a class-level registry, keyed by the C++ pointer of the thread. New
+        entries are created using factory and they are removed when the thread finishes.
+        :param registry: a dictionary (_pools or _idleQueues)
+        :param thread: a QThread instance
+        :param factory: callable returning a new, empty collection of MethodInvoker instances
+        :return: the entry
+        """
+        key = shiboken2.getCppPointer(thread)[0] # pylint: disable=no-member
+        res = registry.get(key, None)
+        if res is None:
+            new = factory()
+            res = registry.setdefault(key, new)
+            if res is new:
+                thread.finished.connect(functools.partial(cls._threadFinished, registry, key), Qt.DirectConnection)
+        return res
+
+    @classmethod
+    def _threadFinished(cls, registry, key):
+        """
+        Removes the entry of a finished thread from the registry. The contained instances will never be executed or
+        reused, so they are also released from methodscalled.
+        :param registry: a dictionary (_pools or _idleQueues)
+        :param key: the C++ pointer of the thread
+        :return: None
+        """
+        entry = registry.pop(key, None)
+        if entry is not None:
+            for invoker in entry:
+                cls.methodscalled.discard(invoker)
+
+    @classmethod
+    def _idleQueue(cls, thread):
+        """
+        Returns the queue of pending idle tasks of the given thread.
+        :param thread: a QThread instance
+        :return: a deque of MethodInvoker instances
+        """
+        return cls._perThread(cls._idleQueues, thread, collections.deque)
+
+    @Slot()
+    def _drainIdle(self):
+        """
+        Slot which runs all idle tasks pending in the thread of this instance.
+        :return: None
+        """
+        queue = self._idleQueue(self.thread())
+        # the queue is emptied at once, so idle tasks posted by the callbacks schedule the next drain and the event
+        # loop is not starved
+        with QMutexLocker(self._idleMutex):
+            tasks = list(queue)
+            queue.clear()
+        for invoker in tasks:
+            self._callDirect(invoker.callbackWrapper, ())
+
     @Slot(object)
     def callbackWrapper(self):
         """
@@ -69,6 +209,12 @@ class MethodInvoker(QObject):
         """
         self.callback(*self.args)
         self.methodscalled.remove(self)
+        if self._pool is not None:
+            if self._connected:
+                self.signal.disconnect(self.callbackWrapper)
+            self.callback = None
+            self.args = None
+            self._pool.append(self)
 
 class ThreadToColor:
     """
@@ -115,25 +261,38 @@ def waitForSignal(signal, callback=None, timeout=None):
     :param timeout: an optional timeout in seconds.
     :return: None
     """
+    loop = QEventLoop()
     _received = False
+    _timedOut = False
     _sigArgs = None
     def _slot(*args, **kw):
         nonlocal _received, _sigArgs
         _sigArgs = args
-        if callback is None:
+        if callback is None or callback(*args, **kw):
             _received = True
-        else:
-            if callback(*args, **kw):
-                _received = True
+            loop.quit()
+    def _timeout():
+        nonlocal _timedOut
+        _timedOut = True
+        loop.quit()
     if not signal.connect(_slot, Qt.QueuedConnection):
         raise NexTInternalError("cannot connect the signal.")
-    t0 = time.perf_counter()
-    while not _received:
-        QCoreApplication.processEvents()
-        if timeout is not None and time.perf_counter() - t0 > timeout:
-            signal.disconnect(_slot)
-            raise TimeoutError()
-    signal.disconnect(_slot)
+    timer = None
+    if timeout is not None:
+        timer = QTimer()
+        timer.setSingleShot(True)
+        timer.timeout.connect(_timeout)
+        timer.start(max(0, int(timeout*1000)))
+    try:
+        # the nested event loop sleeps until events arrive instead of spinning
+        while not _received and not _timedOut:
+            loop.exec_()
+    finally:
+        if timer is not None:
+            timer.stop()
+        signal.disconnect(_slot)
+    if not _received:
+        raise TimeoutError()
     return _sigArgs
 
 class Barrier:
@@ -144,8 +303,11 @@ class Barrier:
     See https://stackoverflow.com/questions/9637374/qt-synchronization-barrier/9639624#9639624
     """
     def __init__(self, count):
-        self.count = count
         self.origCount = count
+        # itertools.count.__next__ is implemented in C and therefore atomic w.r.t. the GIL; it is used as a
+        # lock-free fetch-and-add (PySide2 doesn't wrap QAtomicInt)
+        self._arrivals = itertools.count()
+        self._generation = 0
         self.mutex = QMutex()
         self.condition = QWaitCondition()
 
@@ -154,13 +316,16 @@ class Barrier:
         Wait until all monitored threads called wait.
         :return: None
         """
+        generation, position = divmod(next(self._arrivals), self.origCount)
         self.mutex.lock()
-        self.count -= 1
-        if self.count > 0:
-            self.condition.wait(self.mutex)
-        else:
-            self.count = self.origCount
+        if position == self.origCount - 1:
+            # last arriving thread, release the others; with more than origCount threads, a later generation might
+            # have completed already, so never move backwards
+            self._generation = max(self._generation, generation + 1)
             self.condition.wakeAll()
+        else:
+            while self._generation <= generation:
+                self.condition.wait(self.mutex)
         self.mutex.unlock()
 
 def mainThread():
@@ -175,6 +340,10 @@ def isMainThread():
     check whether current thread is main thread or not
     :return: boolean
     """
+    # Note: the result is intentionally not cached. PySide2's QObject.thread() makes the returned QThread wrapper a
+    # child of the object, so the wrapper gets invalidated together with short-lived objects (e.g. ports).
+    # Calling QCoreApplication.instance().thread() here re-parents the main thread's wrapper to the application,
+    # and other code (e.g. identity checks of QThread wrappers) relies on this.
     return not QCoreApplication.instance() or QThread.currentThread() == mainThread()
 
 def assertMainThread():
@@ -182,64 +351,182 @@ def assertMainThread():
     assert that function is called in main thread, otherwise, a NexTInternalError is raised
     :return: None
     """
-    if not isMainThread():
+    # same as isMainThread(), inlined because this is called very often
+    app = QCoreApplication.instance()
+    if app and QThread.currentThread() != app.thread():
         raise NexTInternalError("Non thread-safe function is called in unexpected thread.")
 
 
+_IDENTIFIER_REGEXP = re.compile(r'[A-Za-z_][A-Za-z0-9_-]*\Z')
+
 def checkIdentifier(name):
     """
     Check that name is a valid nexxT name (c identifier including minus signs). Raises InvalidIdentifierException.
     :param name: string
     :return: None
     """
-    if re.match(r'^[A-Za-z_][A-Za-z0-9_-]*$', name) is None:
+    if _IDENTIFIER_REGEXP.match(name) is None:
         raise InvalidIdentifierException(name)
 
+class _PendingRecords:
+    """
+    The records of an SQLiteHandler which are not yet written to the database, together with the batching policy.
+    """
+    def __init__(self, batchSize, flushInterval, flushLevel):
+        self.batchSize = batchSize
+        self.flushInterval = flushInterval
+        self.flushLevel = flushLevel
+        self.rows = []
+        self.since = None
+
+    def add(self, row, levelno):
+        """
+        Add a row to the pending rows.
+        :param row: the row to be inserted into the database
+        :param levelno: the log level of the row
+        :return: a boolean whether the pending rows shall be written now
+        """
+        now = time.perf_counter()
+        if self.since is None:
+            self.since = now
+        self.rows.append(row)
+        return (len(self.rows) >= self.batchSize or levelno >= self.flushLevel or
+                now - self.since >= self.flushInterval)
+
+    def take(self):
+        """
+        Remove all pending rows.
+        :return: a list of rows
+        """
+        rows = self.rows
+        self.rows = []
+        self.since = None
+        return rows
+
 # https://github.com/ar4s/python-sqlite-logging/blob/master/sqlite_handler.py
-class SQLiteHandler(logging.Handler):
+# the connection attributes depend on the threadSafety mode, so not all of the instance attributes are used at once
+class SQLiteHandler(logging.Handler): # pylint: disable=too-many-instance-attributes
     """
     Logging handler that write logs to SQLite DB
     """
     ONE_CONNECTION_PER_THREAD = 0
     SINGLE_CONNECTION = 1
 
-    def __init__(self, filename, threadSafety=ONE_CONNECTION_PER_THREAD):
+    DURABILITY_FULL = "full"
+    DURABILITY_NORMAL = "normal"
+    DURABILITY_OFF = "off"
+
+    CREATE_TABLE_SQL = ("CREATE TABLE IF NOT EXISTS "
+                        "debug(date datetime, loggername text, filename, srclineno integer, "
+                        "func text, level text, msg text)")
+    INSERT_SQL = "INSERT INTO debug(date, loggername, filename, srclineno, func, level, msg) VALUES(?,?,?,?,?,?,?)"
+
+    def __init__(self, filename, threadSafety=ONE_CONNECTION_PER_THREAD, batchSize=100, flushInterval=1.0,
+                 flushLevel=logging.ERROR, durability=DURABILITY_NORMAL):
         """
-        Construct sqlite handler appending to filename
+        Construct sqlite handler appending to filename. Records are collected in memory and written in a single
+        transaction when either batchSize records are pending, the oldest pending record is older than
+        flushInterval seconds or a record with level >= flushLevel is emitted. If batchSize > 1, a daemon thread
+        writes pending records every flushInterval seconds, so that they are not held back when logging is quiet.
         :param filename:
+        :param threadSafety: one of ONE_CONNECTION_PER_THREAD or SINGLE_CONNECTION
+        :param batchSize: the maximum number of records written in a single transaction
+        :param flushInterval: the maximum age of pending records in seconds
+        :param flushLevel: records with at least this level are written immediately
+        :param durability: one of DURABILITY_FULL, DURABILITY_NORMAL or DURABILITY_OFF, used for sqlite's
+                           synchronous pragma. The database is operated in WAL mode, so DURABILITY_NORMAL is still
+                           crash-consistent.
         """
         logging.Handler.__init__(self)
         self.filename = filename
         self.threadSafety = threadSafety
+        # emit(...) and flush(...) are serialized by the handler's lock, so a single instance is sufficient
+        self._pending = _PendingRecords(batchSize, flushInterval, flushLevel)
+        # the number of logging call sites is finite, so this cache saturates quickly
+        self._abspathCache = {}
+        if durability not in [self.DURABILITY_FULL, self.DURABILITY_NORMAL, self.DURABILITY_OFF]:
+            raise RuntimeError("Unknown durability option %s" % repr(durability))
+        self.durability = durability
         if self.threadSafety == self.SINGLE_CONNECTION:
-            self.dbConn = sqlite3.connect(self.filename, check_same_thread=False)
-            self.dbConn.execute(
-                "CREATE TABLE IF NOT EXISTS "
-                "debug(date datetime, loggername text, filename, srclineno integer, func text, level text, msg text)")
-            self.dbConn.commit()
+            self.dbConn = self._connect(check_same_thread=False)
+            self.dbConn.execute(self.CREATE_TABLE_SQL)
         elif self.threadSafety == self.ONE_CONNECTION_PER_THREAD:
-            self.mutex = QRecursiveMutex()
+            self.mutex = QMutex()
+            # self.dbs is used for bookkeeping, self._tls.db is the lock-free fast path
             self.dbs = {}
+            self._tls = threading.local()
         else:
             raise RuntimeError("Unknown threadSafety option %s" % repr(self.threadSafety))
+        # the emitting threads might not have an event loop, so a plain python thread is used for the time bound
+        self._closing = threading.Event()
+        if batchSize > 1:
+            threading.Thread(target=self._flushLoop, name="SQLiteHandler-flush", daemon=True).start()
+
+    def _flushLoop(self):
+        # flush() reports errors through handleError, so this loop keeps running after a failed write
+        while not self._closing.wait(self._pending.flushInterval):
+            self.flush()
+
+    def _connect(self, **kw):
+        # transactions are managed explicitly in _writePending
+        db = sqlite3.connect(self.filename, isolation_level=None, **kw)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=%s" % self.durability.upper())
+        db.execute("PRAGMA temp_store=MEMORY")
+        db.execute("PRAGMA cache_size=-64000")
+        return db
 
     def _getDB(self):
         if self.threadSafety == self.SINGLE_CONNECTION:
             return self.dbConn
-        # create a new connection for each thread
-        with QMutexLocker(self.mutex):
+        db = getattr(self._tls, "db", None)
+        if db is None:
+            # create a new connection for each thread; only the calling thread uses its connection, so the mutex
+            # is needed just for the shared dictionary. The connection is closed from the thread calling close(),
+            # therefore the same thread check of sqlite3 has to be disabled.
+            db = self._connect(check_same_thread=False)
+            db.execute(self.CREATE_TABLE_SQL)
             tid = QThread.currentThread()
-            if not tid in self.dbs:
-                # Our custom argument
-                db = sqlite3.connect(self.filename)  # might need to use self.filename
-                if len(self.dbs) == 0:
-                    db.execute(
-                        "CREATE TABLE IF NOT EXISTS "
-                        "debug(date datetime, loggername text, filename, srclineno integer, "
-                        "func text, level text, msg text)")
-                    db.commit()
+            with QMutexLocker(self.mutex):
                 self.dbs[tid] = db
-            return self.dbs[tid]
+            self._tls.db = db
+        return db
+
+    def _writePending(self):
+        """
+        Write all pending records to the database using the connection of the calling thread.
+        Callers must hold the handler's lock. If the write fails, the records of this batch are dropped; otherwise
+        each following record would retry the failing write (e.g. waiting for the busy timeout of a locked database).
+        :return: None
+        """
+        if len(self._pending.rows) == 0:
+            return
+        rows = self._pending.take()
+        if self._closing.is_set():
+            # records emitted while the handlers are torn down are dropped
+            return
+        db = self._getDB()
+        db.execute("BEGIN")
+        try:
+            # a single multi-row INSERT ... VALUES (...),(...) statement was measured to be not significantly faster
+            # than executemany (which stays in C), but it would be subject to SQLite's host parameter limit
+            db.executemany(self.INSERT_SQL, rows)
+        except:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    def _writePendingOrReport(self, record=None):
+        """
+        Same as _writePending, but errors are reported through handleError(...) like in the handlers of the standard
+        library instead of being raised to the caller.
+        :param record: the record which caused the write (None if not applicable)
+        :return: None
+        """
+        try:
+            self._writePending()
+        except Exception: # pylint: disable=broad-except
+            self.handleError(record)
 
     def emit(self, record):
         """
@@ -247,24 +534,75 @@ class SQLiteHandler(logging.Handler):
         :param record a logging record
         :return:None
         """
-        db = self._getDB()
-        thisdate = datetime.datetime.now()
-        db.execute(
-            'INSERT INTO debug(date, loggername, filename, srclineno, func, level, msg) VALUES(?,?,?,?,?,?,?)',
-            (
-                thisdate,
-                record.name,
-                os.path.abspath(record.filename),
-                record.lineno,
-                record.funcName,
-                record.levelname,
-                record.msg % record.args,
-            )
+        if self._closing.is_set():
+            return
+        # same format as sqlite3's default adapter, converted here to avoid depending on the global adapter table
+        thisdate = datetime.datetime.now().isoformat(" ")
+        filename = self._abspathCache.get(record.filename, None)
+        if filename is None:
+            filename = os.path.abspath(record.filename)
+            self._abspathCache[record.filename] = filename
+        row = (
+            thisdate,
+            record.name,
+            filename,
+            record.lineno,
+            record.funcName,
+            record.levelname,
+            record.getMessage(),
         )
+        if self._pending.add(row, record.levelno):
+            self._writePendingOrReport(record)
+
+    def flush(self):
+        """
+        write all pending records to the database
+        :return: None
+        """
+        self.acquire()
+        try:
+            self._writePendingOrReport()
+        finally:
+            self.release()
+
+    def close(self):
+        """
+        Write all pending records, truncate the write-ahead log and close the database connections. Note that
+        sqlite checkpoints the write-ahead log automatically while logging, so this is only needed at the end.
+        :return: None
+        """
+        self.acquire()
+        try:
+            try:
+                self._writePendingOrReport()
+            finally:
+                # stops the flush thread and drops records arriving from now on
+                self._closing.set()
+                self._closeConnections()
+        finally:
+            self.release()
+        super().close()
+
+    def _closeConnections(self):
+        """
+        Truncate the write-ahead log and close all database connections. Callers must hold the handler's lock.
+        :return: None
+        """
         if self.threadSafety == self.SINGLE_CONNECTION:
-            pass
+            dbs = [self.dbConn] if self.dbConn is not None else []
+            self.dbConn = None
         else:
-            db.commit()
+            with QMutexLocker(self.mutex):
+                dbs = list(self.dbs.values())
+                self.dbs = {}
+            # invalidate the cached connections of all threads
+            self._tls = threading.local()
+        try:
+            if len(dbs) > 0:
+                dbs[0].execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            for db in dbs:
+                db.close()
 
 class QByteArrayBuffer(io.IOBase):
     """
@@ -276,6 +614,14 @@ class QByteArrayBuffer(io.IOBase):
         logger.warning("Using deprecated class QByteArrayBuffer. Since PySide2 5.14.2 you can cast QByteArrays directly"
                        "to memoryview and this class is not needed anymore.")
         self._ba = qByteArray
+        try:
+            # the C implementation of BytesIO is faster than the python bookkeeping below; it costs one copy
+            self._fast = io.BytesIO(memoryview(qByteArray))
+            self._mv = None
+        except TypeError:
+            # older PySide2 versions, fall back to a single copy
+            self._fast = None
+            self._mv = memoryview(qByteArray.data())
         self._ptr = 0
 
     def readable(self):
@@ -299,31 +645,54 @@ class QByteArrayBuffer(io.IOBase):
         :param size: the number of bytes to be read.
         :return:
         """
+        if self._fast is not None:
+            return self._fast.read(size)
         if size < 0:
             size = self._ba.size() - self._ptr
         oldP = self._ptr
         self._ptr += size
         if self._ptr > self._ba.size():
             self._ptr = self._ba.size()
-        return self._ba[oldP:self._ptr].data()
+        return bytes(self._mv[oldP:self._ptr])
+
+    def readinto(self, buffer):
+        """
+        Read bytes into the given pre-allocated, writable buffer.
+        :param buffer: a writable bytes-like object (e.g. bytearray)
+        :return: the number of bytes read
+        """
+        if self._fast is not None:
+            return self._fast.readinto(buffer)
+        dst = memoryview(buffer).cast("B")
+        oldP = self._ptr
+        self._ptr = min(oldP + dst.nbytes, self._ba.size())
+        n = self._ptr - oldP
+        dst[:n] = self._mv[oldP:self._ptr]
+        return n
 
     def seek(self, offset, whence):
         """
         Implementation of IOBase's seek method.
         :param offset: the offset in bytes (see whence for the explanation)
         :param whence: one of io.SEEK_SET, io.SEEK_CUR, io.SEEK_END
-        :return:
+        :return: the new position
         """
+        ptr = self._fast.tell() if self._fast is not None else self._ptr
         if whence == io.SEEK_SET:
-            self._ptr = offset
+            ptr = offset
         elif whence == io.SEEK_CUR:
-            self._ptr += offset
+            ptr += offset
         elif whence == io.SEEK_END:
-            self._ptr = self._ba.size()
-        if self._ptr < 0:
-            self._ptr = 0
-        elif self._ptr > self._ba.size():
-            self._ptr = self._ba.size()
+            ptr = self._ba.size()
+        if ptr < 0:
+            ptr = 0
+        elif ptr > self._ba.size():
+            ptr = self._ba.size()
+        if self._fast is not None:
+            self._fast.seek(ptr)
+        else:
+            self._ptr = ptr
+        return ptr
 
 # https://stackoverflow.com/questions/6234405/logging-uncaught-exceptions-in-python
 def excepthook(*args):
@@ -347,12 +716,14 @@ def handleException(func):
     :param func: The function to be wrapped
     :return: the wrapped function
     """
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
         except Exception: # pylint: disable=broad-except
-            # catching a general exception is exactly wanted here
-            excepthook(*sys.exc_info())
+            # catching a general exception is exactly wanted here; KeyboardInterrupt is not an Exception, so
+            # this is equivalent to excepthook(*sys.exc_info())
+            logger.exception("Uncaught exception")
     return wrapper
 
 class ElidedLabel(QFrame):
@@ -103,12 +103,13 @@ class MVCPlaybackControlBase(QObject):
                     logger.debug("setSequence %s", filename)
                     if Application.activeApplication.getState() == FilterState.ACTIVE:
                         Application.activeApplication.stop()
-                    MethodInvoker(dict(object=playbackDevice, method="setSequence"), Qt.QueuedConnection, filename)
+                    MethodInvoker.invoke(dict(object=playbackDevice, method="setSequence"), Qt.QueuedConnection,
+                                         filename)
                     Application.activeApplication.start()
                     logger.debug("setSequence done")
                 else:
                     logger.debug("%s does not match filters: %s", filename, nameFilters)
-                    MethodInvoker(dict(object=playbackDevice, method="setSequence"), Qt.QueuedConnection, None)
+                    MethodInvoker.invoke(dict(object=playbackDevice, method="setSequence"), Qt.QueuedConnection, None)
 
             # setSequence is called only if filename matches the given filters
             if self._setSequence.connect(setSequenceWrapper, Qt.DirectConnection):
@@ -127,7 +128,8 @@ class MVCPlaybackControlBase(QObject):
                                                            nameFilters=nameFilters,
                                                            connections=connections)
             self._deviceId += 1
-            MethodInvoker(dict(object=self, method="_updateFeatureSet", thread=mainThread()), Qt.QueuedConnection)
+            MethodInvoker.invoke(dict(object=self, method="_updateFeatureSet", thread=mainThread()),
+                                 Qt.QueuedConnection)
 
     @Slot(QObject)
     def removeConnections(self, playbackDevice):
@@ -150,7 +152,8 @@ class MVCPlaybackControlBase(QObject):
                     del self._registeredDevices[devid]
                 logger.debug("disconnected connections of playback device. number of devices left: %d",
                              len(self._registeredDevices))
-                MethodInvoker(dict(object=self, method="_updateFeatureSet", thread=mainThread()), Qt.QueuedConnection)
+                MethodInvoker.invoke(dict(object=self, method="_updateFeatureSet", thread=mainThread()),
+                                     Qt.QueuedConnection)
 
     def _updateFeatureSet(self):
         assertMainThread()
@@ -18,6 +18,8 @@ from PySide2.QtWidgets import (QWidget, QVBoxLayout, QTreeView, QFileIconProvide
 
 logger = logging.getLogger(__name__)
 
+_IS_WINDOWS = platform.system() == "Windows"
+
 class FolderListModel(QAbstractTableModel):
     """
     This class provides a model for browsing a folder.
@@ -29,6 +31,7 @@ class FolderListModel(QAbstractTableModel):
         self._folder = None
         self._filter = "*"
         self._children = []
+        self._childIsDir = []
         self._iconProvider = QFileIconProvider()
         self._reset(self._folder, self._filter)
 
@@ -67,8 +70,8 @@ class FolderListModel(QAbstractTableModel):
         except ValueError:
             return QModelIndex()
 
-    def _match(self, path):
-        if path.is_dir():
+    def _match(self, path, isDir):
+        if isDir:
             return True
         res = QDir.match(self._filter, path.name)
         return res
@@ -80,23 +83,30 @@ class FolderListModel(QAbstractTableModel):
         if folder is not None:
             listDrives = False
             f = Path(folder).resolve()
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 folder = Path(folder)
                 if folder.name == ".." and folder.parent == Path(folder.drive + "/"):
                     listDrives = True
                     f = Path("<Drives>")
             self._folder = f
             self._filter = flt
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 if listDrives:
-                    self._children = [Path("%s:/" % dl) for dl in string.ascii_uppercase if Path("%s:/" % dl).exists()]
+                    children = [Path("%s:/" % dl) for dl in string.ascii_uppercase if Path("%s:/" % dl).exists()]
                 else:
-                    self._children = [f / ".."]
+                    children = [f / ".."]
             else:
-                self._children = ([] if f.root == f else [f / ".."])
+                children = ([] if f.root == f else [f / ".."])
+            # query the file system only once per child, the result is used for filtering, sorting and data()
+            children = [(c, c.is_dir()) for c in children]
             if not listDrives:
-                self._children += [x for x in f.glob("*") if self._match(x)]
-                self._children.sort(key=lambda c: (c.is_file(), c.drive, int(c.name != ".."), c.name))
+                for x in f.glob("*"):
+                    isDir = x.is_dir()
+                    if self._match(x, isDir):
+                        children.append((x, isDir))
+                children.sort(key=lambda c: (not c[1], c[0].drive, int(c[0].name != ".."), c[0].name))
+            self._children = [c[0] for c in children]
+            self._childIsDir = [c[1] for c in children]
             self.beginInsertRows(QModelIndex(), 0, len(self._children)-1)
             self.endInsertRows()
             if listDrives:
@@ -147,11 +157,12 @@ class FolderListModel(QAbstractTableModel):
         :return:
         """
         c = self._children[index.row()]
+        isDir = self._childIsDir[index.row()]
         if role == Qt.DisplayRole:
             if index.column() == 0:
                 return c.name if c.name != "" else str(c)
             if index.column() == 1:
-                if c.is_dir():
+                if isDir:
                     return ""
                 try:
                     s = c.stat().st_size
@@ -171,7 +182,7 @@ class FolderListModel(QAbstractTableModel):
                     return ""
         if role == Qt.DecorationRole:
             if index.column() == 0:
-                if c.is_dir():
+                if isDir:
                     return self._iconProvider.icon(QFileIconProvider.Drive)
                 return self._iconProvider.icon(QFileInfo(str(c.absolute())))
         if role == Qt.UserRole:
@@ -180,7 +191,7 @@ class FolderListModel(QAbstractTableModel):
         if role in [Qt.DisplayRole, Qt.EditRole]:
             if index.column() == 3:
                 if index.row() > 0:
-                    return str(c) + (os.path.sep if c.is_dir() else "")
+                    return str(c) + (os.path.sep if isDir else "")
                 return str(c.parent) + os.path.sep
         return None
 
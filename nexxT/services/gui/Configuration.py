@@ -359,7 +359,7 @@ class MVCConfigurationGUI(MVCConfigurationBase):
             self.activeAppStateChange(app.getState())
             app.stateChanged.connect(self.activeAppStateChange)
             if self._waitForActivated == app.getApplication():
-                MethodInvoker(self.activate, Qt.QueuedConnection)
+                MethodInvoker.invoke(self.activate, Qt.QueuedConnection)
         else:
             self.actActivate.setEnabled(False)
             self.actDeactivate.setEnabled(False)
@@ -377,7 +377,7 @@ class MVCConfigurationGUI(MVCConfigurationBase):
     def _singleShotPlay(self):
         assertMainThread()
         pbsrv = Services.getService("PlaybackControl")
-        MethodInvoker(pbsrv.startPlayback, Qt.QueuedConnection)
+        MethodInvoker.invoke(pbsrv.startPlayback, Qt.QueuedConnection)
         self._disconnectSingleShotPlay()
 
     def activeAppStateChange(self, newState):
@@ -401,7 +401,7 @@ class MVCConfigurationGUI(MVCConfigurationBase):
                     if startPlay:
                         pbsrv.playbackPaused.connect(self._singleShotPlay)
                         QTimer.singleShot(2000, self._disconnectSingleShotPlay)
-                    MethodInvoker(pbsrv.setSequence, Qt.QueuedConnection, pbfile)
+                    MethodInvoker.invoke(pbsrv.setSequence, Qt.QueuedConnection, pbfile)
             self.actDeactivate.setEnabled(True)
         else:
             self.actDeactivate.setEnabled(False)
@@ -0,0 +1,474 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (C) 2020 ifm electronic gmbh
+#
+# THE PROGRAM IS PROVIDED "AS IS" WITHOUT WARRANTY OF ANY KIND.
+#
+
+import collections
+import datetime
+import io
+import logging
+import os
+import sqlite3
+import sys
+import time
+import shiboken2
+from PySide2.QtCore import QCoreApplication, QByteArray, QThread, QMutex, QMutexLocker, QTimer, QObject, Qt
+from nexxT.core.Utils import (SQLiteHandler, QByteArrayBuffer, Barrier, waitForSignal, checkIdentifier, isMainThread,
+                              assertMainThread, MethodInvoker, handleException)
+from nexxT.core.Exceptions import InvalidIdentifierException, NexTInternalError
+
+def setup():
+    global app
+    app = QCoreApplication.instance()
+    if app is None:
+        app = QCoreApplication()
+
+def numRecords(filename):
+    db = sqlite3.connect(filename)
+    try:
+        if db.execute("SELECT name FROM sqlite_master WHERE name='debug'").fetchone() is None:
+            return 0
+        return db.execute("SELECT COUNT(*) FROM debug").fetchone()[0]
+    finally:
+        db.close()
+
+def test_sqliteHandlerBatching(tmp_path):
+    for threadSafety in [SQLiteHandler.ONE_CONNECTION_PER_THREAD, SQLiteHandler.SINGLE_CONNECTION]:
+        filename = str(tmp_path / ("log%d.db" % threadSafety))
+        handler = SQLiteHandler(filename, threadSafety, batchSize=10, flushInterval=3600)
+        logger = logging.getLogger("test_sqliteHandlerBatching")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(handler)
+        try:
+            for i in range(9):
+                logger.info("record %d", i)
+            assert numRecords(filename) == 0
+            logger.info("record %d", 9)
+            assert numRecords(filename) == 10
+            logger.info("record %d", 10)
+            assert numRecords(filename) == 10
+            logger.error("error record")
+            assert numRecords(filename) == 12
+            logger.info("record %d", 11)
+            handler.flush()
+            assert numRecords(filename) == 13
+            # non-string messages are converted like in other handlers
+            logger.info(ValueError("value error"))
+            logger.info({"a": 1})
+            handler.flush()
+            db = sqlite3.connect(filename)
+            assert [r[0] for r in db.execute("SELECT msg FROM debug ORDER BY rowid DESC LIMIT 3")] == [
+                "{'a': 1}", "value error", "record 11"]
+            db.close()
+            db = sqlite3.connect(filename)
+            assert db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            date = db.execute("SELECT date FROM debug LIMIT 1").fetchone()[0]
+            assert datetime.datetime.fromisoformat(date).isoformat(" ") == date
+            db.close()
+            logger.info("pending record")
+        finally:
+            logger.removeHandler(handler)
+        handler.close()
+        assert numRecords(filename) == 16
+        # records arriving after close are dropped
+        handler.emit(logging.LogRecord("late", logging.INFO, __file__, 1, "late record", None, None))
+        handler.flush()
+        handler.close()
+        assert numRecords(filename) == 16
+
+def test_sqliteHandlerFlushInterval(tmp_path):
+    filename = str(tmp_path / "log.db")
+    handler = SQLiteHandler(filename, batchSize=100, flushInterval=0.1)
+    logger = logging.getLogger("test_sqliteHandlerFlushInterval")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    try:
+        logger.info("single record")
+        assert numRecords(filename) == 0
+        # the record is written without further logging activity
+        t0 = time.perf_counter()
+        while numRecords(filename) == 0 and time.perf_counter() - t0 < 5:
+            time.sleep(0.05)
+        assert numRecords(filename) == 1
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+def test_sqliteHandlerErrors(tmp_path, monkeypatch):
+    filename = str(tmp_path / "log.db")
+    handler = SQLiteHandler(filename, SQLiteHandler.SINGLE_CONNECTION, batchSize=2, flushInterval=0.1)
+    # don't wait the default 5 seconds for the locked database
+    handler.dbConn.execute("PRAGMA busy_timeout=100")
+    errors = []
+    monkeypatch.setattr(handler, "handleError", lambda record: errors.append(sys.exc_info()[0]))
+    logger = logging.getLogger("test_sqliteHandlerErrors")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    try:
+        locker = sqlite3.connect(filename, isolation_level=None)
+        locker.execute("BEGIN IMMEDIATE")
+        try:
+            # the failing write is reported, but not raised to the logging call
+            logger.info("record 1")
+            logger.info("record 2")
+            logger.info("record 3")
+            t0 = time.perf_counter()
+            while len(errors) < 2 and time.perf_counter() - t0 < 5:
+                time.sleep(0.05)
+            assert len(errors) >= 2
+            assert set(errors) == {sqlite3.OperationalError}
+        finally:
+            locker.execute("ROLLBACK")
+            locker.close()
+        # the periodic flush is still working
+        logger.info("record 4")
+        t0 = time.perf_counter()
+        while numRecords(filename) == 0 and time.perf_counter() - t0 < 5:
+            time.sleep(0.05)
+        db = sqlite3.connect(filename)
+        assert db.execute("SELECT msg FROM debug ORDER BY rowid DESC LIMIT 1").fetchone()[0] == "record 4"
+        db.close()
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+def test_sqliteHandlerThreads(tmp_path):
+    filename = str(tmp_path / "log.db")
+    handler = SQLiteHandler(filename, SQLiteHandler.ONE_CONNECTION_PER_THREAD, batchSize=1)
+    logger = logging.getLogger("test_sqliteHandlerThreads")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+
+    class MyThread(QThread):
+        def run(self):
+            for i in range(20):
+                logger.info("record %d", i)
+
+    try:
+        threads = [MyThread() for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            assert t.wait(10000)
+        assert numRecords(filename) == 80
+        assert len(handler.dbs) == 4
+    finally:
+        logger.removeHandler(handler)
+    handler.close()
+    assert len(handler.dbs) == 0
+    assert not os.path.exists(filename + "-wal") or os.path.getsize(filename + "-wal") == 0
+    assert numRecords(filename) == 80
+
+def test_qByteArrayBuffer():
+    buf = QByteArrayBuffer(QByteArray(b"0123456789"))
+    assert buf.read(3) == b"012"
+    dst = bytearray(4)
+    assert buf.readinto(dst) == 4
+    assert dst == b"3456"
+    buf.seek(-2, io.SEEK_CUR)
+    assert buf.read() == b"56789"
+    assert buf.readinto(dst) == 0
+    buf.seek(8, io.SEEK_SET)
+    assert buf.tell() == 8
+    assert buf.readinto(dst) == 2
+    assert dst[:2] == b"89"
+    assert buf.seek(20, io.SEEK_SET) == 10
+    assert buf.seek(-20, io.SEEK_CUR) == 0
+    assert buf.read(-1) == b"0123456789"
+
+def test_barrier():
+    n = 5
+    rounds = 20
+    barrier = Barrier(n)
+    mutex = QMutex()
+    arrived = [0]*rounds
+    errors = []
+
+    class MyThread(QThread):
+        def run(self):
+            for r in range(rounds):
+                with QMutexLocker(mutex):
+                    arrived[r] += 1
+                barrier.wait()
+                with QMutexLocker(mutex):
+                    if arrived[r] != n:
+                        errors.append(r)
+
+    threads = [MyThread() for _ in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        assert t.wait(10000)
+    assert errors == []
+    assert arrived == [n]*rounds
+
+def test_waitForSignal():
+    timer = QTimer()
+    timer.setInterval(10)
+    ticks = []
+    timer.timeout.connect(lambda: ticks.append(len(ticks)))
+    timer.start()
+    try:
+        t0 = time.process_time()
+        waitForSignal(timer.timeout, lambda: len(ticks) >= 10, timeout=5)
+        # waiting must not burn cpu
+        assert time.process_time() - t0 < 0.05
+        t0 = time.perf_counter()
+        try:
+            waitForSignal(timer.timeout, lambda: False, timeout=0.1)
+            assert False
+        except TimeoutError:
+            pass
+        assert time.perf_counter() - t0 < 1
+    finally:
+        timer.stop()
+
+def test_checkIdentifier():
+    for name in ["a", "_", "filter", "my-filter_2", "A9-"]:
+        checkIdentifier(name)
+    for name in ["", "9a", "-a", "a b", "a.b", "a\n", "\u00e4"]:
+        try:
+            checkIdentifier(name)
+            assert False, name
+        except InvalidIdentifierException:
+            pass
+
+def test_isMainThread():
+    results = []
+
+    class MyThread(QThread):
+        def run(self):
+            results.append(isMainThread())
+            try:
+                assertMainThread()
+                results.append(False)
+            except NexTInternalError:
+                results.append(True)
+
+    assert isMainThread()
+    assertMainThread()
+    t = MyThread()
+    t.start()
+    assert t.wait(10000)
+    assert results == [False, True]
+    assert isMainThread()
+
+def test_methodInvokerPool():
+    calls = []
+
+    class Receiver(QObject):
+        def method(self, *args):
+            calls.append((QThread.currentThread() == self.thread(),) + args)
+
+    r = Receiver()
+    for i in range(3):
+        MethodInvoker.invoke(r.method, Qt.DirectConnection, i)
+    assert calls == [(True, 0), (True, 1), (True, 2)]
+    calls.clear()
+    for i in range(10):
+        MethodInvoker.invoke(dict(object=r, method="method"), Qt.QueuedConnection, i, "q")
+    MethodInvoker.invoke(r.method, MethodInvoker.IDLE_TASK, "idle")
+    assert calls == []
+    t = QTimer()
+    t.start(50)
+    waitForSignal(t.timeout)
+    assert calls == [(True, i, "q") for i in range(10)] + [(True, "idle")]
+    # the second batch reuses the invokers of the first batch
+    numInvokers = sum(len(p) for p in MethodInvoker._pools.values())
+    for i in range(10):
+        MethodInvoker.invoke(r.method, Qt.QueuedConnection, i)
+    waitForSignal(t.timeout)
+    assert sum(len(p) for p in MethodInvoker._pools.values()) == numInvokers
+    assert len(calls) == 21
+
+def test_handleException(caplog):
+    @handleException
+    def func(a, b=1):
+        """docstring"""
+        return a/b
+
+    assert func.__name__ == "func" and func.__doc__ == "docstring"
+    assert func(4, b=2) == 2
+    with caplog.at_level(logging.ERROR):
+        assert func(1, 0) is None
+    assert [r.message for r in caplog.records] == ["Uncaught exception"]
+    assert caplog.records[0].exc_info[0] is ZeroDivisionError
+
+def test_methodInvokerPoolFromThreads():
+    n = 4
+    calls = []
+    errors = []
+
+    class Receiver(QObject):
+        def method(self, i):
+            calls.append(i)
+
+    class SlowDeque(collections.deque):
+        def __len__(self):
+            res = super().__len__()
+            # make sure that all threads see the same length before any of them pops from the pool
+            time.sleep(0.01)
+            return res
+
+    class MyThread(QThread):
+        def __init__(self, k, barrier):
+            super().__init__()
+            self.k = k
+            self.barrier = barrier
+
+        def run(self):
+            self.barrier.wait()
+            try:
+                MethodInvoker.invoke(r.method, Qt.QueuedConnection, self.k)
+            except Exception as e: # pylint: disable=broad-except
+                errors.append(e)
+
+    r = Receiver()
+    key = shiboken2.getCppPointer(QCoreApplication.instance().thread())[0]
+    origPool = MethodInvoker._pools.get(key, None)
+    MethodInvoker._pools[key] = SlowDeque(maxlen=MethodInvoker.POOL_SIZE)
+    try:
+        # put a single invoker into the pool
+        MethodInvoker.invoke(r.method, Qt.QueuedConnection, -1)
+        QCoreApplication.processEvents()
+        assert calls == [-1] and len(MethodInvoker._pools[key]) == 1
+        barrier = Barrier(n)
+        threads = [MyThread(k, barrier) for k in range(n)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            assert t.wait(10000)
+        assert errors == []
+        t0 = time.perf_counter()
+        while len(calls) < n + 1 and time.perf_counter() - t0 < 5:
+            QCoreApplication.processEvents()
+        assert sorted(calls) == list(range(-1, n))
+    finally:
+        if origPool is None:
+            del MethodInvoker._pools[key]
+        else:
+            MethodInvoker._pools[key] = origPool
+
+def test_methodInvokerIdleTasks():
+    calls = []
+
+    class Receiver(QObject):
+        def method(self, i):
+            calls.append(i)
+            if i == 0:
+                # posted from an idle task, executed after the tasks which are already pending
+                MethodInvoker.invoke(self.method, MethodInvoker.IDLE_TASK, 100)
+
+    r = Receiver()
+    # pylint: disable=unused-variable
+    # need to hold the references of these until the methods are called
+    invokers = [MethodInvoker(r.method, MethodInvoker.IDLE_TASK, i) for i in range(5)]
+    for i in range(5, 10):
+        MethodInvoker.invoke(r.method, MethodInvoker.IDLE_TASK, i)
+    assert calls == []
+    t = QTimer()
+    t.start(50)
+    waitForSignal(t.timeout)
+    assert calls == list(range(10)) + [100]
+
+def test_methodInvokerIdleTasksFromThreads():
+    n = 8
+    calls = []
+
+    class Receiver(QObject):
+        def method(self, i):
+            calls.append(i)
+
+    class SlowDeque(collections.deque):
+        def append(self, x):
+            super().append(x)
+            # make sure that all threads append before any of them decides whether to schedule the drain
+            time.sleep(0.01)
+
+    class MyThread(QThread):
+        def __init__(self, k, barrier):
+            super().__init__()
+            self.k = k
+            self.barrier = barrier
+
+        def run(self):
+            self.barrier.wait()
+            # the posting threads don't have an event loop
+            MethodInvoker.invoke(r.method, MethodInvoker.IDLE_TASK, self.k)
+
+    r = Receiver()
+    key = shiboken2.getCppPointer(QCoreApplication.instance().thread())[0]
+    origQueue = MethodInvoker._idleQueues.get(key, None)
+    assert not origQueue
+    MethodInvoker._idleQueues[key] = SlowDeque()
+    try:
+        for trial in range(3):
+            barrier = Barrier(n)
+            threads = [MyThread(k, barrier) for k in range(n)]
+            for t in threads:
+                t.start()
+            t0 = time.perf_counter()
+            while len(calls) < n*(trial+1) and time.perf_counter() - t0 < 5:
+                QCoreApplication.processEvents()
+            for t in threads:
+                assert t.wait(10000)
+            assert sorted(calls[n*trial:]) == list(range(n))
+    finally:
+        if origQueue is None:
+            del MethodInvoker._idleQueues[key]
+        else:
+            MethodInvoker._idleQueues[key] = origQueue
+
+def test_methodInvokerIdleTaskFromThreadWithoutEventLoop():
+    calls = []
+
+    class Receiver(QObject):
+        def method(self, i):
+            calls.append(i)
+
+    class MyThread(QThread):
+        def run(self):
+            MethodInvoker.invoke(r.method, MethodInvoker.IDLE_TASK, 0)
+
+    r = Receiver()
+    t = MyThread()
+    t.start()
+    assert t.wait(10000)
+    # the task of the finished thread must neither be lost nor block the following tasks
+    MethodInvoker.invoke(r.method, MethodInvoker.IDLE_TASK, 1)
+    t0 = time.perf_counter()
+    while len(calls) < 2 and time.perf_counter() - t0 < 5:
+        QCoreApplication.processEvents()
+    assert calls == [0, 1]
+
+def test_methodInvokerThreadFinished():
+    calls = []
+
+    class Receiver(QObject):
+        def method(self, i):
+            calls.append(i)
+
+    t = QThread()
+    r = Receiver()
+    r.moveToThread(t)
+    t.start()
+    try:
+        for i in range(3):
+            MethodInvoker.invoke(r.method, Qt.QueuedConnection, i)
+        MethodInvoker.invoke(r.method, MethodInvoker.IDLE_TASK, 3)
+        t0 = time.perf_counter()
+        while len(calls) < 4 and time.perf_counter() - t0 < 5:
+            time.sleep(0.01)
+        assert calls == [0, 1, 2, 3]
+        assert len(MethodInvoker._pools[shiboken2.getCppPointer(t)[0]]) > 0
+    finally:
+        t.quit()
+        assert t.wait(10000)
+    # the per-thread bookkeeping is removed when the thread finishes
+    assert shiboken2.getCppPointer(t)[0] not in MethodInvoker._pools
+    assert shiboken2.getCppPointer(t)[0] not in MethodInvoker._idleQueues